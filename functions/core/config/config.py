@@ -1,4 +1,5 @@
 # MVP Configuration - Simple and focused
+import functools
 import os
 
 # Core audio processing parameters
@@ -28,10 +29,13 @@ FIREBASE_CONFIG = {
     'project_id': os.environ.get('GCP_PROJECT') or os.environ.get('GOOGLE_CLOUD_PROJECT'),
 }
 
+@functools.lru_cache(maxsize=1)
 def get_config():
     """
     Get MVP configuration for vocal biomarker analysis pipeline.
     
+    The dictionary is built once and shared by every caller; treat it as read-only.
+    
     Returns:
         Dict[str, Any]: Configuration dictionary containing:
             - audio: Audio processing parameters
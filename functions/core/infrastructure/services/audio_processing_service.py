@@ -7,6 +7,7 @@ providing better separation of concerns and testability.
 Reference: DATA_STANDARDS.md §3.2.1
 """
 
+import math
 import os
 import logging
 import tempfile
@@ -15,7 +16,7 @@ import numpy as np
 import soundfile as sf
 
 from config import get_config
-from utilities.firebase_utils import FirebaseManager, FirestoreOperations, StorageOperations
+from utilities.firebase_utils import get_firebase_manager, FirestoreOperations, StorageOperations
 from utilities.tool_versions import ToolVersions
 from utilities.unified_logger import get_voice_logger, log_context
 from utilities.constants import (
@@ -29,7 +30,7 @@ from utilities.constants import (
     METADATA_VOICED_FRAMES
 )
 from feature_extraction_pipeline import FeatureExtractionPipeline
-from utilities.audio_utils import convert_to_mono, resample_audio, calculate_duration, calculate_rms
+from utilities.audio_utils import convert_to_mono, resample_audio, calculate_duration, calculate_mean_square
 
 logger = get_voice_logger("audio_processing_service")
 
@@ -52,11 +53,17 @@ class AudioProcessingService:
         if not self.config.get("audio") or not self.config.get("firebase"):
             raise ValueError("Invalid or missing configuration")
         
-        self.firebase_manager = FirebaseManager(
+        # Bind hot-path thresholds once instead of re-walking the config per clip
+        self._target_sr = self.config['audio']['target_sample_rate']
+        self._min_dur = self.config['audio']['min_duration_seconds']
+        self._max_dur = self.config['audio']['max_duration_seconds']
+        self._min_rms = self.config['quality_gate']['min_rms_threshold']
+        self._min_rms_squared = self._min_rms ** 2
+        
+        self.firebase_manager = get_firebase_manager(
             project_id=self.config['firebase']['project_id'],
             cred_path=os.environ.get("GOOGLE_APPLICATION_CREDENTIALS")
         )
-        self.firebase_manager.initialize()
         
         self.firestore_ops = FirestoreOperations(self.firebase_manager)
         self.storage_ops = StorageOperations(self.firebase_manager)
@@ -72,7 +79,8 @@ class AudioProcessingService:
     def _build_processing_metadata(self, duration: float, sample_rate: int, voiced_ratio: float = None) -> Dict[str, Any]:
         """Build processing metadata dictionary."""
         # Calculate frames based on Praat's default time step (0.01s = 100 Hz)
-        total_frames = int(duration / 0.01)  # Total frames at 10ms intervals
+        frames_per_second = 100
+        total_frames = int(duration * frames_per_second)  # Total frames at 10ms intervals
         voiced_frames = int(total_frames * voiced_ratio) if voiced_ratio else total_frames
         
         return {
@@ -103,91 +111,113 @@ class AudioProcessingService:
             if not file_name.startswith(SAGE_AUDIO_FILES_PREFIX):
                 raise ValueError(f"Invalid file path structure: {file_name}")
             
-            # Remove prefix and split path components
+            # Remove prefix; only the first and last path components matter
             path_without_prefix = file_name[len(SAGE_AUDIO_FILES_PREFIX):]
-            path_parts = path_without_prefix.split('/')
+            user_id, separator, _ = path_without_prefix.partition('/')
+            recording_id = path_without_prefix.rpartition('/')[2].removesuffix(WAV_EXTENSION)
             
-            if len(path_parts) >= 2:
+            if separator:
                 # New structure: sage-audio-files/{user_id}/{recording_id}.wav
-                user_id = path_parts[0]
-                filename = path_parts[-1]
-                recording_id = filename.replace(WAV_EXTENSION, '')
                 return {'recording_id': recording_id, 'user_id': user_id}
-            elif len(path_parts) == 1:
-                # Legacy structure: sage-audio-files/{recording_id}.wav
-                filename = path_parts[0]
-                recording_id = filename.replace(WAV_EXTENSION, '')
-                return {'recording_id': recording_id}
-            else:
-                raise ValueError(f"Invalid path structure: {file_name}")
+            # Legacy structure: sage-audio-files/{recording_id}.wav
+            return {'recording_id': recording_id}
         except Exception as e:
-            self.logger.exception("File path parsing failed")
+            self.logger.error("File path parsing failed", error=e, extra={"file_name": file_name})
             raise
 
-    def validate_audio_quality(self, audio: np.ndarray, sample_rate: int) -> bool:
+    def _is_duration_in_range(self, duration: float) -> bool:
+        """Check duration against the configured quality gate bounds."""
+        if duration < self._min_dur:
+            self.logger.warning("Audio too short", extra={
+                "duration_seconds": duration,
+                "min_duration_seconds": self._min_dur
+            })
+            return False
+        if duration > self._max_dur:
+            self.logger.warning("Audio too long", extra={
+                "duration_seconds": duration,
+                "max_duration_seconds": self._max_dur
+            })
+            return False
+        return True
+
+    def validate_audio_quality(self, audio: np.ndarray, sample_rate: int,
+                               duration: Optional[float] = None) -> bool:
         """
         Validate audio quality for processing.
         
         Args:
             audio: Audio data as numpy array
             sample_rate: Sample rate in Hz
+            duration: Precomputed duration in seconds (computed from audio if omitted)
             
         Returns:
             True if audio quality is sufficient for processing
         """
-        try:
-            duration = calculate_duration(audio, sample_rate)
-            min_duration = self.config['audio']['min_duration_seconds']
-            max_duration = self.config['audio']['max_duration_seconds']
-            if duration < min_duration:
-                self.logger.warning(f"Audio too short: {duration:.2f}s < {min_duration}s")
-                return False
-            if duration > max_duration:
-                self.logger.warning(f"Audio too long: {duration:.2f}s > {max_duration}s")
+        if duration is None:
+            try:
+                duration = calculate_duration(audio, sample_rate)
+            except Exception as e:
+                self.logger.error("Quality gate failed", error=e)
                 return False
-            rms = calculate_rms(audio)
-            min_rms = self.config['quality_gate']['min_rms_threshold']
-            if rms < min_rms:
-                self.logger.warning(f"Audio too quiet: RMS {rms:.6f} < {min_rms}")
-                return False
-            self.logger.info(f"Quality gate passed: duration={duration:.2f}s, RMS={rms:.6f}")
-            return True
-        except Exception as e:
-            self.logger.exception("Quality gate failed")
+        if not self._is_duration_in_range(duration):
             return False
+        # Compare energy in the squared domain: one dot product, no sqrt
+        mean_square = calculate_mean_square(audio)
+        if mean_square < self._min_rms_squared:
+            self.logger.warning("Audio too quiet", extra={
+                "rms": math.sqrt(mean_square),
+                "min_rms_threshold": self._min_rms
+            })
+            return False
+        self.logger.info("Quality gate passed", extra={
+            "duration_seconds": duration,
+            "rms": math.sqrt(mean_square)
+        })
+        return True
 
-    def _load_and_process_audio(self, temp_file_path: str, file_name: str, bucket_name: str) -> Optional[str]:
+    def _load_and_process_audio(self, temp_file_path: str, file_name: str, bucket_name: str,
+                                file_info: Dict[str, str]) -> Optional[str]:
         """
         Shared logic for loading, validating, extracting, and storing audio features.
+
+        Args:
+            temp_file_path: Local path of the downloaded audio file
+            file_name: Storage file path
+            bucket_name: Storage bucket name
+            file_info: Parsed path components from parse_file_path
         """
         try:
-            audio, sample_rate = sf.read(temp_file_path)
+            # Reject on the WAV header's duration before decoding any samples
+            if not self._is_duration_in_range(sf.info(temp_file_path).duration):
+                self.logger.error("Audio failed quality gate")
+                return None
+            # Decode straight to float32: half the memory of soundfile's float64
+            # default for the decoded buffer and every downstream copy
+            audio, sample_rate = sf.read(temp_file_path, dtype='float32')
             audio = convert_to_mono(audio, sample_rate)
-            audio = resample_audio(
-                audio,
-                sample_rate,
-                self.config['audio']['target_sample_rate']
-            )
-            sample_rate = self.config['audio']['target_sample_rate']
+            # Gate on the mono signal before resampling so rejected clips
+            # never pay for the resample pass (duration is rate-independent)
             duration = calculate_duration(audio, sample_rate)
-            if not self.validate_audio_quality(audio, sample_rate):
+            if not self.validate_audio_quality(audio, sample_rate, duration):
                 self.logger.error("Audio failed quality gate")
                 return None
+            audio = resample_audio(audio, sample_rate, self._target_sr)
+            sample_rate = self._target_sr
             features = self.pipeline.run_for_firestore(audio, sample_rate)
             # Extract voiced_ratio from features for accurate metadata
             voiced_ratio = features.get('vocal_analysis_metadata_voiced_ratio', 0.0)
             processing_metadata = self._build_processing_metadata(duration, sample_rate, voiced_ratio)
             tool_versions = ToolVersions.get_analysis_versions()
-            file_info = self.parse_file_path(file_name)
             recording_id = file_info['recording_id']
             user_id = file_info.get('user_id')  # May be None for legacy paths
             doc_id = self.firestore_ops.store_voice_analysis_results(
                 recording_id, features, processing_metadata, tool_versions, self.analysis_version, user_id
             )
-            self.logger.info(f"Processing completed successfully for {file_name}")
+            self.logger.info("Processing completed successfully", extra={"file_name": file_name})
             return doc_id
         except Exception as e:
-            self.logger.exception(f"Processing failed for {file_name}")
+            self.logger.error("Processing failed", error=e, extra={"file_name": file_name})
             raise
 
     def process_audio_file(self, bucket_name: str, file_name: str) -> Optional[str]:
@@ -195,6 +225,7 @@ class AudioProcessingService:
         Process audio file through the complete voice analysis pipeline using context manager.
         """
         # Extract context for logging
+        file_info = {}
         recording_id = None
         user_id = None
         try:
@@ -223,12 +254,13 @@ class AudioProcessingService:
         temp_file_path = None
         try:
             with tempfile.NamedTemporaryFile(delete=False, suffix=WAV_EXTENSION) as temp_file:
+                # Record the path first so a failed download is still cleaned up
+                temp_file_path = temp_file.name
                 bucket = self.firebase_manager.storage_client.bucket(bucket_name)
                 blob = bucket.blob(file_name)
-                blob.download_to_filename(temp_file.name)
-                temp_file_path = temp_file.name
+                blob.download_to_filename(temp_file_path)
                 
-            result = self._load_and_process_audio(temp_file_path, file_name, bucket_name)
+            result = self._load_and_process_audio(temp_file_path, file_name, bucket_name, file_info)
             
             self.logger.info("Audio processing completed", extra={
                 "file_name": file_name,
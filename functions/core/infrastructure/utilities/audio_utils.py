@@ -8,32 +8,38 @@ Reference: DATA_STANDARDS.md §3.2.1
 """
 
 import numpy as np
-import librosa
-import soundfile as sf
 from typing import Union
 
 
 def convert_to_mono(audio: np.ndarray, sample_rate: int) -> np.ndarray:
     """
-    Convert stereo audio to mono with shape validation.
+    Convert stereo audio to mono by averaging channels into float32.
     
     Args:
         audio: Audio data as numpy array
         sample_rate: Audio sample rate in Hz (unused but kept for interface consistency)
         
     Returns:
-        Mono audio data
+        Mono audio data as a C-contiguous float32 array
         
     Raises:
         ValueError: If audio data is invalid
     """
-    if len(audio.shape) > 1:
-        # Check if we need to transpose (librosa expects time as first dimension)
-        if audio.shape[0] < audio.shape[1]:
-            # Audio is in (channels, time) format, transpose to (time, channels)
-            audio = audio.T
-        return librosa.to_mono(audio.T)
-    return audio
+    if audio.ndim == 1:
+        # No-op (same object) for the float32 contiguous buffers soundfile returns
+        return np.ascontiguousarray(audio, dtype=np.float32)
+    if audio.ndim == 2 and min(audio.shape) == 1:
+        # Single-channel 2-D input (e.g. soundfile with always_2d): flatten as a view
+        return np.ascontiguousarray(audio.reshape(-1), dtype=np.float32)
+    if audio.shape[-1] == 2 and audio.shape[0] > 2:
+        # Common interleaved stereo (time, 2): one fused add, then scale in place
+        mono = np.add(audio[:, 0], audio[:, 1], dtype=np.float32)
+        mono *= np.float32(0.5)
+        return mono
+    # Channels are the shorter dimension: (channels, time) or (time, channels)
+    channel_axis = 0 if audio.shape[0] < audio.shape[1] else 1
+    # Average straight into float32, with no transposed copy
+    return np.mean(audio, axis=channel_axis, dtype=np.float32)
 
 
 def resample_audio(audio: np.ndarray, original_rate: int, target_rate: int) -> np.ndarray:
@@ -46,14 +52,21 @@ def resample_audio(audio: np.ndarray, original_rate: int, target_rate: int) -> n
         target_rate: Target sample rate in Hz
         
     Returns:
-        Resampled audio data
+        Resampled audio data as a C-contiguous float32 array
         
     Raises:
         ValueError: If sample rates are invalid
     """
-    if original_rate != target_rate:
-        return librosa.resample(audio, orig_sr=original_rate, target_sr=target_rate)
-    return audio
+    # Keep soxr on its single-precision path and hand downstream code float32
+    audio = np.ascontiguousarray(audio, dtype=np.float32)
+    if original_rate == target_rate:
+        return audio
+    # Deferred import: the resampler only loads on cold starts that actually
+    # need it. soxr is what librosa.resample dispatches to by default
+    # (res_type='soxr_hq'); calling it directly skips librosa's validation pass
+    # and apply_along_axis wrapper, and keeps float32 input in float32.
+    import soxr
+    return soxr.resample(audio, original_rate, target_rate, quality='HQ')
 
 
 def calculate_duration(audio: np.ndarray, sample_rate: int) -> float:
@@ -83,20 +96,40 @@ def calculate_rms(audio: np.ndarray) -> float:
         audio: Audio data as numpy array
         
     Returns:
-        RMS energy value
+        RMS energy value, or 0.0 for empty audio
+    """
+    return float(np.sqrt(calculate_mean_square(audio)))
+
+
+def calculate_mean_square(audio: np.ndarray) -> float:
+    """
+    Calculate mean-square energy (RMS squared) of audio signal.
+    
+    Uses a single dot product, so no squared temporary is allocated and
+    callers comparing against a threshold can skip the square root.
+    
+    Args:
+        audio: Audio data as numpy array (multi-channel input is flattened)
         
-    Raises:
-        ValueError: If audio data is empty or invalid
+    Returns:
+        Mean-square energy value, or 0.0 for empty audio
     """
-    return np.sqrt(np.mean(audio**2))
+    if audio.size == 0:
+        return 0.0
+    # np.dot is a matrix product on N-D input; flatten (a view when contiguous)
+    flat = audio.reshape(-1)
+    return float(np.dot(flat, flat)) / flat.size
 
 
 def safe_mean(values: np.ndarray) -> float:
     """
     Safely calculate mean, returning 0 if array is empty.
     
+    Returns a Python float (not a numpy scalar) because results are stored
+    in Firestore, which cannot serialize numpy types.
+    
     Args:
-        values: Array of numeric values
+        values: numpy array of numeric values
         
     Returns:
         Mean value or 0.0 if array is empty
@@ -104,7 +137,7 @@ def safe_mean(values: np.ndarray) -> float:
     Raises:
         ValueError: If values array is None
     """
-    return float(np.mean(values)) if len(values) > 0 else 0.0
+    return float(np.mean(values)) if values.size else 0.0
 
 
 def safe_std(values: np.ndarray) -> float:
@@ -112,7 +145,7 @@ def safe_std(values: np.ndarray) -> float:
     Safely calculate standard deviation, returning 0 if array is empty.
     
     Args:
-        values: Array of numeric values
+        values: numpy array of numeric values
         
     Returns:
         Standard deviation or 0.0 if array is empty
@@ -120,7 +153,7 @@ def safe_std(values: np.ndarray) -> float:
     Raises:
         ValueError: If values array is None
     """
-    return float(np.std(values)) if len(values) > 0 else 0.0
+    return float(np.std(values)) if values.size else 0.0
 
 
 def validate_audio_quality(audio: np.ndarray, sample_rate: int, 
@@ -140,15 +173,38 @@ def validate_audio_quality(audio: np.ndarray, sample_rate: int,
     Returns:
         True if audio quality is sufficient for processing
     """
-    if audio is None or len(audio) == 0:
+    if audio is None or audio.size == 0:
         return False
     
     duration = calculate_duration(audio, sample_rate)
-    if duration < min_duration or duration > max_duration:
+    if not min_duration <= duration <= max_duration:
         return False
     
-    rms = calculate_rms(audio)
-    if rms < min_rms:
-        return False
+    return _mean_square_reaches(audio, min_rms * min_rms)
+
+
+def _mean_square_reaches(audio: np.ndarray, min_mean_square: float, block: int = 16384) -> bool:
+    """
+    Check mean-square energy against a threshold, block by block.
+    
+    Sums squares over cache-sized views and returns as soon as the running
+    total guarantees a pass, so clips that are loud early skip the rest of
+    the buffer. Quiet clips still scan it all.
     
-    return True 
\ No newline at end of file
+    Args:
+        audio: Non-empty audio data as numpy array
+        min_mean_square: Minimum mean-square energy (RMS threshold squared)
+        block: Samples per block (16384 float32 samples = 64 KB)
+        
+    Returns:
+        True if the mean-square energy is at least min_mean_square
+    """
+    flat = audio.reshape(-1)
+    target = min_mean_square * flat.size
+    total = 0.0
+    for start in range(0, flat.size, block):
+        chunk = flat[start:start + block]
+        total += float(np.dot(chunk, chunk))
+        if total >= target:
+            return True
+    return False
@@ -29,28 +29,49 @@ Environment Variables:
 """
 
 import os
-from typing import Set, Dict, Any
+from types import MappingProxyType
+from typing import FrozenSet, Dict, Any
 from threading import Lock
 
-# Global debug state
-_debug_components: Set[str] = set()
-_debug_flags: Dict[str, bool] = {}
-_debug_lock = Lock()
+# Debug environment variables, read once at import: the environment does not
+# change after the function instance starts
+_DEBUG_ENV_VARS = (
+    'SAGE_DEBUG_COMPONENTS',
+    'SAGE_DEBUG_PERFORMANCE',
+    'SAGE_DEBUG_FIRESTORE',
+    'SAGE_DEBUG_AUDIO',
+    'SAGE_DEBUG_PARSELMOUTH',
+)
+_ENV_SNAPSHOT = MappingProxyType({name: os.environ.get(name) for name in _DEBUG_ENV_VARS})
+
+# Global debug state. Both are immutable snapshots: writers build a new
+# object under _debug_lock and rebind the name, so readers never lock.
+_debug_components: FrozenSet[str] = frozenset()
+_debug_flags: Dict[str, bool] = {}  # Replaced wholesale, never mutated in place
+_debug_lock = Lock()  # Serializes writers only
+# Per-component is_debug_enabled results for the current _debug_components.
+# Writers replace it with a fresh dict after publishing new components.
+_debug_cache: Dict[str, bool] = {}
 
 def _load_debug_config():
     """Load debug configuration from environment variables"""
+    global _debug_components, _debug_flags, _debug_cache
     with _debug_lock:
         # Load debug components from environment
-        debug_env = os.environ.get('SAGE_DEBUG_COMPONENTS', '')
+        debug_env = _ENV_SNAPSHOT['SAGE_DEBUG_COMPONENTS'] or ''
         if debug_env:
             components = [c.strip() for c in debug_env.split(',')]
-            _debug_components.update(components)
+            _debug_components = _debug_components.union(components)
+            _debug_cache = {}
             
         # Load specific debug flags
-        _debug_flags['performance'] = os.environ.get('SAGE_DEBUG_PERFORMANCE', 'false').lower() == 'true'
-        _debug_flags['firestore'] = os.environ.get('SAGE_DEBUG_FIRESTORE', 'false').lower() == 'true'
-        _debug_flags['audio'] = os.environ.get('SAGE_DEBUG_AUDIO', 'false').lower() == 'true'
-        _debug_flags['parselmouth'] = os.environ.get('SAGE_DEBUG_PARSELMOUTH', 'false').lower() == 'true'
+        _debug_flags = {
+            **_debug_flags,
+            'performance': (_ENV_SNAPSHOT['SAGE_DEBUG_PERFORMANCE'] or 'false').lower() == 'true',
+            'firestore': (_ENV_SNAPSHOT['SAGE_DEBUG_FIRESTORE'] or 'false').lower() == 'true',
+            'audio': (_ENV_SNAPSHOT['SAGE_DEBUG_AUDIO'] or 'false').lower() == 'true',
+            'parselmouth': (_ENV_SNAPSHOT['SAGE_DEBUG_PARSELMOUTH'] or 'false').lower() == 'true',
+        }
 
 # Load configuration on import
 _load_debug_config()
@@ -62,8 +83,10 @@ def enable_debug(component: str = "*") -> None:
     Args:
         component: Component name or "*" for all components
     """
+    global _debug_components, _debug_cache
     with _debug_lock:
-        _debug_components.add(component)
+        _debug_components = _debug_components | {component}
+        _debug_cache = {}
 
 def disable_debug(component: str = None) -> None:
     """
@@ -72,11 +95,13 @@ def disable_debug(component: str = None) -> None:
     Args:
         component: Component name or None to disable all
     """
+    global _debug_components, _debug_cache
     with _debug_lock:
         if component is None:
-            _debug_components.clear()
+            _debug_components = frozenset()
         else:
-            _debug_components.discard(component)
+            _debug_components = _debug_components - {component}
+        _debug_cache = {}
 
 def is_debug_enabled(component: str) -> bool:
     """
@@ -88,8 +113,14 @@ def is_debug_enabled(component: str) -> bool:
     Returns:
         True if debug is enabled for this component
     """
-    with _debug_lock:
-        return "*" in _debug_components or component in _debug_components
+    # Read the cache before the components: a result computed from stale
+    # components can only land in a cache that writers have already replaced
+    cache = _debug_cache
+    enabled = cache.get(component)
+    if enabled is None:
+        components = _debug_components  # One snapshot read; no lock needed
+        enabled = cache[component] = "*" in components or component in components
+    return enabled
 
 def is_flag_enabled(flag: str) -> bool:
     """
@@ -101,8 +132,7 @@ def is_flag_enabled(flag: str) -> bool:
     Returns:
         True if the flag is enabled
     """
-    with _debug_lock:
-        return _debug_flags.get(flag, False)
+    return _debug_flags.get(flag, False)
 
 def get_debug_info() -> Dict[str, Any]:
     """
@@ -111,18 +141,12 @@ def get_debug_info() -> Dict[str, Any]:
     Returns:
         Dictionary with debug configuration info
     """
-    with _debug_lock:
-        return {
-            "debug_components": list(_debug_components),
-            "debug_flags": _debug_flags.copy(),
-            "environment_vars": {
-                "SAGE_DEBUG_COMPONENTS": os.environ.get('SAGE_DEBUG_COMPONENTS'),
-                "SAGE_DEBUG_PERFORMANCE": os.environ.get('SAGE_DEBUG_PERFORMANCE'),
-                "SAGE_DEBUG_FIRESTORE": os.environ.get('SAGE_DEBUG_FIRESTORE'),
-                "SAGE_DEBUG_AUDIO": os.environ.get('SAGE_DEBUG_AUDIO'),
-                "SAGE_DEBUG_PARSELMOUTH": os.environ.get('SAGE_DEBUG_PARSELMOUTH'),
-            }
-        }
+    return {
+        "debug_components": list(_debug_components),
+        "debug_flags": _debug_flags.copy(),
+        # Plain dict copy so the payload stays JSON/Firestore serializable
+        "environment_vars": dict(_ENV_SNAPSHOT)
+    }
 
 def set_debug_flag(flag: str, enabled: bool) -> None:
     """
@@ -132,8 +156,9 @@ def set_debug_flag(flag: str, enabled: bool) -> None:
         flag: Flag name
         enabled: Whether to enable the flag
     """
+    global _debug_flags
     with _debug_lock:
-        _debug_flags[flag] = enabled
+        _debug_flags = {**_debug_flags, flag: enabled}
 
 # Common debug configurations
 def enable_all_debug():
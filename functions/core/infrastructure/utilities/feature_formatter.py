@@ -7,10 +7,28 @@ for Firestore storage and consistent data handling.
 Reference: DATA_STANDARDS.md §3.2.1
 """
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator, Tuple
 from entities import FeatureSet
 
 
+def _unprefixed_items(fs: FeatureSet) -> Iterator[Tuple[str, Any]]:
+    """Yield a feature set's fields in Firestore order, before extractor namespacing."""
+    # Features, then version
+    yield from fs.features.items()
+    yield "version", fs.version
+    
+    # Error information if present
+    if fs.error:
+        yield "error_type", fs.error
+        yield "error_message", fs.error_message
+    
+    # Metadata if present, skipping unset fields
+    if fs.metadata:
+        for key, value in fs.metadata.__dict__.items():
+            if value is not None:
+                yield f"metadata_{key}", value
+
+
 class FeatureFormatter:
     """Utility class for formatting and aggregating feature sets."""
     
@@ -25,29 +43,13 @@ class FeatureFormatter:
         Returns:
             Dictionary with namespaced feature keys and metadata
         """
-        flattened = {}
-        
-        for fs in feature_sets:
-            # Add features with extractor namespace
-            for key, value in fs.features.items():
-                namespaced_key = f"{fs.extractor}_{key}"
-                flattened[namespaced_key] = value
-            
-            # Add version information
-            flattened[f"{fs.extractor}_version"] = fs.version
-            
-            # Add error information if present
-            if fs.error:
-                flattened[f"{fs.extractor}_error_type"] = fs.error
-                flattened[f"{fs.extractor}_error_message"] = fs.error_message
-            
-            # Add metadata if present
-            if fs.metadata:
-                for key, value in fs.metadata.__dict__.items():
-                    if value is not None:
-                        flattened[f"{fs.extractor}_metadata_{key}"] = value
-        
-        return flattened
+        # Build each extractor's namespace prefix once, not once per key
+        return {
+            prefix + key: value
+            for fs in feature_sets
+            for prefix in (f"{fs.extractor}_",)
+            for key, value in _unprefixed_items(fs)
+        }
     
     @staticmethod
     def format_for_firestore(feature_sets: List[FeatureSet]) -> Dict[str, Any]:
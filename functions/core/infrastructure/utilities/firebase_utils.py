@@ -9,6 +9,7 @@ Reference: DATA_STANDARDS.md §3.2.1
 
 import os
 import logging
+import functools
 from typing import Dict, Any, Optional
 import firebase_admin
 from firebase_admin import credentials, firestore
@@ -75,6 +76,27 @@ class FirebaseManager:
         return self._storage_client
 
 
+@functools.lru_cache(maxsize=None)
+def get_firebase_manager(project_id: str, cred_path: Optional[str] = None) -> FirebaseManager:
+    """
+    Get an initialized Firebase manager shared across the process.
+    
+    Firebase apps are process-global, so one manager (and its Firestore and
+    Storage clients) is reused per project instead of reconnecting each time
+    a service is constructed.
+    
+    Args:
+        project_id: Google Cloud project ID
+        cred_path: Path to service account credentials file (optional)
+        
+    Returns:
+        Initialized FirebaseManager instance
+    """
+    firebase_manager = FirebaseManager(project_id=project_id, cred_path=cred_path)
+    firebase_manager.initialize()
+    return firebase_manager
+
+
 class FirestoreOperations:
     """Handles Firestore operations for voice analysis results."""
     
@@ -7,15 +7,186 @@ with cloud logging systems and consistent logging across the application.
 Reference: DATA_STANDARDS.md §3.2.1
 """
 
+import functools
+import os
+import sys
+import time
 import logging
+import threading
 import json
-from typing import Dict, Any, Optional
-from datetime import datetime, timezone
+import traceback
+from typing import Dict, Any, Optional, TextIO
+from datetime import datetime
+
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # Optional: fall back to the stdlib serializer
+    orjson = None
+else:
+    _ORJSON_OPTIONS = (orjson.OPT_UTC_Z | orjson.OPT_NAIVE_UTC |
+                       orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS)
+
+
+def _json_default(value: Any) -> Any:
+    """
+    Serialize values the JSON encoders do not handle natively.
+    
+    Datetimes render as UTC 'Z' ISO strings (matching orjson), numpy scalars
+    become their Python equivalents, and anything else falls back to str() so
+    a logging call never fails on an unexpected field type.
+    """
+    if isinstance(value, datetime):
+        return value.isoformat().replace('+00:00', 'Z')
+    if isinstance(value, np.generic):
+        return value.item()
+    return str(value)
+
+
+def _dumps(value: Any) -> str:
+    """Serialize a value to a JSON string, with orjson when available."""
+    if orjson is not None:
+        # C serializer; numpy values and non-str keys (both common in feature
+        # and metric fields) are accepted like the stdlib path accepts them
+        return orjson.dumps(value, default=_json_default, option=_ORJSON_OPTIONS).decode()
+    return json.dumps(value, default=_json_default)
+
+
+def _format_traceback(exc: BaseException) -> str:
+    """
+    Format an exception's traceback for the JSON record.
+    
+    Args:
+        exc: Exception to format
+        
+    Returns:
+        Formatted traceback text
+    """
+    return ''.join(traceback.format_exception(type(exc), exc, exc.__traceback__))
+
+
+# Per-thread cache of the last formatted millisecond timestamp
+_timestamp_cache = threading.local()
+
+
+def _utc_timestamp() -> str:
+    """
+    Get the current UTC time as an ISO 8601 string with millisecond precision.
+    
+    Records logged within the same millisecond on a thread reuse the cached
+    string instead of formatting the clock again.
+    
+    Returns:
+        Timestamp such as '2024-01-01T12:00:00.123Z'
+    """
+    now_ms = time.time_ns() // 1_000_000
+    if getattr(_timestamp_cache, 'ms', None) != now_ms:
+        seconds, millis = divmod(now_ms, 1000)
+        _timestamp_cache.iso = f"{time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(seconds))}.{millis:03d}Z"
+        _timestamp_cache.ms = now_ms
+    return _timestamp_cache.iso
+
+
+# Longest time an INFO/DEBUG record may wait for a flush, enforced by a timer
+LOG_FLUSH_INTERVAL_SECONDS = 1.0
+
+
+class BufferedStreamHandler(logging.StreamHandler):
+    """
+    StreamHandler that lets the stream's own buffer batch records.
+    
+    logging.StreamHandler flushes after every record, which costs one write
+    syscall per log line. This handler flushes immediately only for WARNING and
+    above, so problems are never held back. Other records stay in the stream
+    buffer until the next flush, which happens at the latest when a one-shot
+    timer fires LOG_FLUSH_INTERVAL_SECONDS after the first unflushed record.
+    Callers should still call flush_logs() at the end of each request: Cloud
+    Functions throttles CPU between invocations (delaying the timer) and
+    SIGTERM skips logging.shutdown().
+    """
+    
+    def __init__(self, stream: Optional[TextIO] = None,
+                 flush_interval: float = LOG_FLUSH_INTERVAL_SECONDS):
+        """
+        Initialize buffered handler.
+        
+        Args:
+            stream: Buffered text stream to write records to (default sys.stderr,
+                as for logging.StreamHandler)
+            flush_interval: Maximum seconds a record waits before being flushed
+        """
+        super().__init__(stream)
+        self.flush_interval = flush_interval
+        self._flush_timer: Optional[threading.Timer] = None
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        """Write a record, flushing now if urgent and otherwise within flush_interval."""
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+            if record.levelno >= logging.WARNING:
+                self.flush()
+            elif self._flush_timer is None:
+                # emit() runs under the handler lock, so only one timer is armed
+                self._flush_timer = threading.Timer(self.flush_interval, self.flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+        except Exception:
+            self.handleError(record)
+    
+    def flush(self) -> None:
+        """Flush the stream and disarm any pending flush timer."""
+        self.acquire()
+        try:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            super().flush()
+        finally:
+            self.release()
+
+
+_stdout_handler: Optional[logging.Handler] = None
+
+
+def _get_stdout_handler() -> logging.Handler:
+    """
+    Get the handler shared by all structured loggers.
+    
+    Records are written to sys.stdout itself, so they batch in its buffer and
+    stay in order with anything else printed to stdout. SAGE_LOG_UNBUFFERED=1
+    switches to a plain StreamHandler that flushes after every record.
+    
+    Returns:
+        Shared logging handler writing JSON messages to stdout
+    """
+    global _stdout_handler
+    if _stdout_handler is None:
+        handler: logging.Handler
+        if os.environ.get("SAGE_LOG_UNBUFFERED") == "1":
+            handler = logging.StreamHandler(sys.stdout)
+        else:
+            handler = BufferedStreamHandler(sys.stdout)
+        handler.setFormatter(logging.Formatter('%(message)s'))  # Ensure pure JSON
+        _stdout_handler = handler
+    return _stdout_handler
+
+
+def flush_logs() -> None:
+    """Write out any structured log records still buffered (call at the end of each request)."""
+    if _stdout_handler is not None:
+        _stdout_handler.flush()
+
+
+# Base record keys; see StructuredLogger._format_log
+_RESERVED_FIELDS = frozenset(('timestamp', 'severity', 'logger', 'message'))
 
 
 class StructuredLogger:
     """Structured logger for cloud logging integration."""
     
+    __slots__ = ('logger', 'name', '_prefixes')
+    
     def __init__(self, name: str, level: int = logging.INFO):
         """
         Initialize structured logger.
@@ -27,72 +198,111 @@ class StructuredLogger:
         self.logger = logging.getLogger(name)
         self.logger.setLevel(level)
         self.name = name
+        # Invariant JSON between the timestamp and the message, per severity
+        self._prefixes = {
+            severity: self._build_prefix(severity)
+            for severity in ('DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL')
+        }
         
         # Ensure logs go to stdout as clean JSON for cloud environments
         if not self.logger.handlers:
-            handler = logging.StreamHandler()
-            handler.setFormatter(logging.Formatter('%(message)s'))  # Ensure pure JSON
-            self.logger.addHandler(handler)
+            self.logger.addHandler(_get_stdout_handler())
+    
+    def _build_prefix(self, severity: str) -> str:
+        """Build the invariant JSON fragment between the timestamp and the message."""
+        return f'","severity":{_dumps(severity)},"logger":{_dumps(self.name)},'
     
-    def _format_log(self, level: str, message: str, trace_id: Optional[str] = None, **kwargs) -> str:
+    def _format_log(self, level: str, message: str, fields: Dict[str, Any]) -> str:
         """
         Format log message as structured JSON.
         
+        Only the timestamp, message and extra fields are serialized per record;
+        the severity and logger name come from a precomputed prefix. Fields are
+        emitted in the order timestamp, severity, logger, message, extras.
+        
         Args:
             level: Log level
             message: Log message
-            trace_id: Optional correlation/trace ID for distributed tracing
-            **kwargs: Additional structured fields
+            fields: Additional structured fields, taken over from the caller's
+                kwargs rather than copied; an optional 'trace_id' correlation
+                ID is moved to the end and dropped if empty. A field named
+                like a base key replaces that key's value
             
         Returns:
             JSON formatted log string
         """
-        log_data = {
-            'timestamp': datetime.now(timezone.utc).isoformat(),
-            'severity': level.upper(),
-            'logger': self.name,
-            'message': message,
-            **kwargs
-        }
+        prefix = self._prefixes.get(level)
+        if prefix is None:
+            prefix = self._build_prefix(level.upper())
         
+        trace_id = fields.pop('trace_id', None)
         if trace_id:
-            log_data['trace_id'] = trace_id
-            
-        return json.dumps(log_data)
+            fields['trace_id'] = trace_id
+        if not _RESERVED_FIELDS.isdisjoint(fields):
+            # A caller field overrides a base key; the spliced prefix would
+            # emit it twice, so build the whole record as one dict instead
+            return _dumps({
+                'timestamp': _utc_timestamp(),
+                'severity': level.upper(),
+                'logger': self.name,
+                'message': message,
+                **fields
+            })
+        # One serializer call for the per-record fields, spliced in after the
+        # prefix (timestamps contain no characters that need JSON escaping)
+        tail = _dumps({'message': message, **fields})
+        return f'{{"timestamp":"{_utc_timestamp()}{prefix}{tail[1:]}'
     
     def info(self, message: str, **kwargs) -> None:
         """Log info message with structured data."""
-        formatted_message = self._format_log('INFO', message, **kwargs)
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        formatted_message = self._format_log('INFO', message, kwargs)
         self.logger.info(formatted_message)
     
     def warning(self, message: str, **kwargs) -> None:
         """Log warning message with structured data."""
-        formatted_message = self._format_log('WARNING', message, **kwargs)
+        if not self.logger.isEnabledFor(logging.WARNING):
+            return
+        formatted_message = self._format_log('WARNING', message, kwargs)
         self.logger.warning(formatted_message)
     
     def error(self, message: str, exc: Optional[Exception] = None, **kwargs) -> None:
         """Log error message with structured data and optional exception info."""
+        if not self.logger.isEnabledFor(logging.ERROR):
+            return
         if exc:
             kwargs['exception'] = str(exc)
-        formatted_message = self._format_log('ERROR', message, **kwargs)
-        self.logger.error(formatted_message, exc_info=bool(exc))
+            # Traceback goes in the JSON record; exc_info would have the handler
+            # format it a second time and append it as non-JSON text
+            kwargs['stack_trace'] = _format_traceback(exc)
+        formatted_message = self._format_log('ERROR', message, kwargs)
+        self.logger.error(formatted_message)
     
     def debug(self, message: str, **kwargs) -> None:
         """Log debug message with structured data."""
-        formatted_message = self._format_log('DEBUG', message, **kwargs)
+        # Skip the dict build, timestamp and serialization for filtered records
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
+        formatted_message = self._format_log('DEBUG', message, kwargs)
         self.logger.debug(formatted_message)
     
     def critical(self, message: str, exc: Optional[Exception] = None, **kwargs) -> None:
         """Log critical message with structured data and optional exception info."""
+        if not self.logger.isEnabledFor(logging.CRITICAL):
+            return
         if exc:
             kwargs['exception'] = str(exc)
-        formatted_message = self._format_log('CRITICAL', message, **kwargs)
-        self.logger.critical(formatted_message, exc_info=bool(exc))
+            kwargs['stack_trace'] = _format_traceback(exc)
+        formatted_message = self._format_log('CRITICAL', message, kwargs)
+        self.logger.critical(formatted_message)
 
 
 class AudioProcessingLogger(StructuredLogger):
     """Specialized logger for audio processing operations."""
     
+    __slots__ = ()
+    
     def log_audio_processing_start(self, file_name: str, bucket_name: str) -> None:
         """Log start of audio processing."""
         self.info(
@@ -146,6 +356,8 @@ class AudioProcessingLogger(StructuredLogger):
 class FirestoreLogger(StructuredLogger):
     """Specialized logger for Firestore operations."""
     
+    __slots__ = ()
+    
     def log_firestore_store_success(self, recording_id: str, doc_id: str) -> None:
         """Log successful Firestore storage."""
         self.info(
@@ -166,9 +378,10 @@ class FirestoreLogger(StructuredLogger):
         )
 
 
+@functools.lru_cache(maxsize=128)
 def get_structured_logger(name: str) -> StructuredLogger:
     """
-    Get a structured logger instance.
+    Get a structured logger instance, shared per name.
     
     Args:
         name: Logger name
@@ -179,9 +392,10 @@ def get_structured_logger(name: str) -> StructuredLogger:
     return StructuredLogger(name)
 
 
+@functools.lru_cache(maxsize=1)
 def get_audio_processing_logger() -> AudioProcessingLogger:
     """
-    Get an audio processing logger instance.
+    Get the shared audio processing logger instance.
     
     Returns:
         AudioProcessingLogger instance
@@ -189,9 +403,10 @@ def get_audio_processing_logger() -> AudioProcessingLogger:
     return AudioProcessingLogger("audio_processing")
 
 
+@functools.lru_cache(maxsize=1)
 def get_firestore_logger() -> FirestoreLogger:
     """
-    Get a Firestore logger instance.
+    Get the shared Firestore logger instance.
     
     Returns:
         FirestoreLogger instance
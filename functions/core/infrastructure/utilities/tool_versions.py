@@ -7,6 +7,7 @@ to avoid hardcoding and enable easy version management.
 Reference: DATA_STANDARDS.md §3.2.1
 """
 
+import functools
 from typing import Dict
 
 
@@ -16,7 +17,7 @@ class ToolVersions:
     # Audio processing tools
     PRAAT_VERSION = "6.4.1"
     PARSELMOUTH_VERSION = "0.4.6"
-    LIBROSA_VERSION = "0.10.1"
+    SOXR_VERSION = "1.1.0"
     SOUNDFILE_VERSION = "0.12.1"
     
     # Analysis pipeline
@@ -28,13 +29,18 @@ class ToolVersions:
         return {
             'praat': cls.PRAAT_VERSION,
             'parselmouth': cls.PARSELMOUTH_VERSION,
-            'librosa': cls.LIBROSA_VERSION,
+            'soxr': cls.SOXR_VERSION,
             'soundfile': cls.SOUNDFILE_VERSION
         }
     
     @classmethod
+    @functools.lru_cache(maxsize=1)
     def get_analysis_versions(cls) -> Dict[str, str]:
-        """Get versions for feature extraction tools (Praat, Parselmouth)."""
+        """
+        Get versions for feature extraction tools (Praat, Parselmouth).
+        
+        Built once and shared by every caller (one per processed file); treat as read-only.
+        """
         return {
             'praat': cls.PRAAT_VERSION,
             'parselmouth': cls.PARSELMOUTH_VERSION
@@ -46,7 +52,7 @@ class ToolVersions:
         return {
             'praat': cls.PRAAT_VERSION,
             'parselmouth': cls.PARSELMOUTH_VERSION,
-            'librosa': cls.LIBROSA_VERSION,
+            'soxr': cls.SOXR_VERSION,
             'soundfile': cls.SOUNDFILE_VERSION,
             'analysis_version': cls.ANALYSIS_VERSION
         }
@@ -0,0 +1,190 @@
+"""
+Tests for audio processing utilities.
+
+This module tests the audio utility functions used by the processing
+service, focusing on channel handling and shape preservation.
+"""
+
+import unittest
+import numpy as np
+
+from utilities.audio_utils import (convert_to_mono, resample_audio, calculate_mean_square, calculate_rms,
+                                  safe_mean, safe_std, validate_audio_quality)
+
+
+class TestConvertToMono(unittest.TestCase):
+    """Test cases for convert_to_mono."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up shared read-only fixtures."""
+        cls.sample_rate = 48000
+        cls.test_audio = np.linspace(-0.5, 0.5, 4800, dtype=np.float32)
+        cls.test_audio.flags.writeable = False
+        
+        # Zero-copy stereo views in both channel layouts
+        n = len(cls.test_audio)
+        cls.stereo_tc = np.broadcast_to(cls.test_audio[:, np.newaxis], (n, 2))
+        cls.stereo_ct = np.broadcast_to(cls.test_audio[np.newaxis, :], (2, n))
+
+    def test_mono_input_returned_without_copy(self):
+        """Test that 1-D audio is returned as-is."""
+        # When: Converting audio that is already mono
+        result = convert_to_mono(self.test_audio, self.sample_rate)
+
+        # Then: Should return the same array without allocating
+        self.assertIs(result, self.test_audio)
+
+    def test_float64_or_strided_input_returned_as_float32_contiguous(self):
+        """Test that mono input is normalized to a contiguous float32 buffer."""
+        for audio in (self.test_audio.astype(np.float64), self.test_audio[::2]):
+            with self.subTest(dtype=audio.dtype, contiguous=audio.flags.c_contiguous):
+                # When: Converting mono input that is float64 or strided
+                result = convert_to_mono(audio, self.sample_rate)
+
+                # Then: Should be float32, contiguous and numerically unchanged
+                self.assertEqual(result.dtype, np.float32)
+                self.assertTrue(result.flags.c_contiguous)
+                np.testing.assert_allclose(result, audio, rtol=1e-6)
+
+    def test_single_channel_2d_input_flattened_as_view(self):
+        """Test that (time, 1) and (1, time) audio is flattened without copying."""
+        for audio in (self.test_audio[:, np.newaxis], self.test_audio[np.newaxis, :]):
+            with self.subTest(shape=audio.shape):
+                # When: Converting single-channel 2-D audio
+                result = convert_to_mono(audio, self.sample_rate)
+
+                # Then: Should be 1-D and share memory with the input
+                self.assertEqual(result.shape, (len(self.test_audio),))
+                self.assertTrue(np.shares_memory(result, self.test_audio))
+
+    def test_stereo_layouts_reduced_to_mono(self):
+        """Test that (time, channels) and (channels, time) stereo both reduce to mono."""
+        for stereo in (self.stereo_tc, self.stereo_ct):
+            with self.subTest(shape=stereo.shape):
+                # When: Converting identical-channel stereo to mono
+                result = convert_to_mono(stereo, self.sample_rate)
+
+                # Then: Should collapse to the shared channel
+                self.assertEqual(result.shape, (len(self.test_audio),))
+                np.testing.assert_allclose(result, self.test_audio, rtol=1e-6)
+
+    def test_stereo_input_averaged(self):
+        """Test that distinct stereo channels are averaged."""
+        # Given: Stereo audio with one silent channel
+        stereo = np.column_stack((self.test_audio, np.zeros_like(self.test_audio)))
+
+        # When: Converting to mono
+        result = convert_to_mono(stereo, self.sample_rate)
+
+        # Then: Should average the two channels into float32
+        self.assertEqual(result.dtype, np.float32)
+        np.testing.assert_allclose(result, self.test_audio * 0.5, rtol=1e-6)
+
+
+class TestResampleAudio(unittest.TestCase):
+    """Test cases for resample_audio."""
+
+    def test_same_rate_returns_input(self):
+        """Test that matching rates return the input without resampling."""
+        audio = np.zeros(4800, dtype=np.float32)
+        self.assertIs(resample_audio(audio, 48000, 48000), audio)
+
+    def test_rate_change_scales_length(self):
+        """Test that resampling scales the sample count by the rate ratio."""
+        audio = np.zeros(4800, dtype=np.float32)
+        self.assertEqual(len(resample_audio(audio, 48000, 16000)), 1600)
+
+    def test_float64_input_resampled_to_float32(self):
+        """Test that float64 input is resampled in single precision."""
+        result = resample_audio(np.zeros(4800, dtype=np.float64), 48000, 16000)
+        self.assertEqual(result.dtype, np.float32)
+
+
+class TestCalculateMeanSquare(unittest.TestCase):
+    """Test cases for calculate_mean_square."""
+
+    def test_matches_mean_of_squares(self):
+        """Test that the dot-product result equals mean(audio ** 2)."""
+        # Given: A float32 sine-like ramp
+        audio = np.linspace(-0.5, 0.5, 4800, dtype=np.float32)
+
+        # When: Calculating mean-square energy
+        result = calculate_mean_square(audio)
+
+        # Then: Should match the squared-array mean
+        self.assertAlmostEqual(result, float(np.mean(audio.astype(np.float64) ** 2)), places=6)
+
+    def test_empty_audio_returns_zero(self):
+        """Test that empty audio has zero energy rather than raising."""
+        self.assertEqual(calculate_mean_square(np.array([], dtype=np.float32)), 0.0)
+
+
+class TestCalculateRms(unittest.TestCase):
+    """Test cases for calculate_rms."""
+
+    def test_constant_signal_rms(self):
+        """Test that a constant signal's RMS equals its magnitude."""
+        audio = np.full(4800, -0.25, dtype=np.float32)
+        self.assertAlmostEqual(calculate_rms(audio), 0.25, places=6)
+
+    def test_multichannel_audio_rms(self):
+        """Test that 2-D input is reduced over all samples, not as a matrix product."""
+        for shape in ((100, 2), (2, 2)):
+            with self.subTest(shape=shape):
+                self.assertAlmostEqual(calculate_rms(np.ones(shape, dtype=np.float32)), 1.0, places=6)
+
+    def test_empty_audio_returns_zero(self):
+        """Test that empty audio has zero RMS rather than NaN."""
+        self.assertEqual(calculate_rms(np.array([], dtype=np.float32)), 0.0)
+
+
+class TestSafeStatistics(unittest.TestCase):
+    """Test cases for safe_mean and safe_std."""
+
+    def test_returns_python_float(self):
+        """Test that results are Firestore-serializable Python floats."""
+        values = np.array([210.0, 230.0], dtype=np.float32)
+        for fn, expected in ((safe_mean, 220.0), (safe_std, 10.0)):
+            with self.subTest(fn=fn.__name__):
+                result = fn(values)
+                self.assertIs(type(result), float)
+                self.assertAlmostEqual(result, expected, places=4)
+
+    def test_empty_values_return_zero(self):
+        """Test that empty arrays return 0.0 rather than NaN."""
+        empty = np.array([], dtype=np.float32)
+        self.assertEqual(safe_mean(empty), 0.0)
+        self.assertEqual(safe_std(empty), 0.0)
+
+
+class TestValidateAudioQuality(unittest.TestCase):
+    """Test cases for the module-level validate_audio_quality."""
+
+    def test_quality_gate_cases(self):
+        """Test empty, duration-bound and RMS-threshold decisions."""
+        sample_rate = 1000
+        cases = [
+            ("empty", np.array([], dtype=np.float32), False),
+            ("too_short", np.full(499, 0.1, dtype=np.float32), False),
+            ("too_long", np.full(30001, 0.1, dtype=np.float32), False),
+            ("at_rms_threshold", np.full(500, 0.001, dtype=np.float32), True),
+            ("below_rms_threshold", np.full(500, 0.0009, dtype=np.float32), False),
+        ]
+        for name, audio, expected in cases:
+            with self.subTest(case=name):
+                self.assertIs(validate_audio_quality(audio, sample_rate), expected)
+
+    def test_energy_in_final_block_passes(self):
+        """Test that the blocked energy check still sees energy past the first block."""
+        # Given: 20 s of silence with a loud final second
+        sample_rate = 1000
+        audio = np.zeros(20 * sample_rate, dtype=np.float32)
+        audio[-sample_rate:] = 0.1
+
+        # When/Then: Should pass once the last block is summed
+        self.assertTrue(validate_audio_quality(audio, sample_rate))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+"""
+Tests for debug configuration.
+
+This module tests enabling and disabling debug components and flags
+through the debug_config module.
+"""
+
+import unittest
+
+from utilities import debug_config
+
+
+class TestDebugConfig(unittest.TestCase):
+    """Test cases for debug component and flag management."""
+
+    def setUp(self):
+        """Restore the module's debug state after each test."""
+        saved = (debug_config._debug_components, debug_config._debug_flags, debug_config._debug_cache)
+
+        def restore():
+            (debug_config._debug_components, debug_config._debug_flags,
+             debug_config._debug_cache) = saved
+
+        self.addCleanup(restore)
+        debug_config.disable_debug()
+
+    def test_enable_and_disable_component(self):
+        """Test that components toggle independently."""
+        # When: Enabling one component
+        debug_config.enable_debug("feature_extraction")
+
+        # Then: Only that component is enabled
+        self.assertTrue(debug_config.is_debug_enabled("feature_extraction"))
+        self.assertFalse(debug_config.is_debug_enabled("firebase_utils"))
+
+        # When: Disabling it again
+        debug_config.disable_debug("feature_extraction")
+
+        # Then: It is no longer enabled
+        self.assertFalse(debug_config.is_debug_enabled("feature_extraction"))
+
+    def test_cached_result_invalidated_on_change(self):
+        """Test that memoized checks see later enable/disable calls."""
+        # Given: A cached negative result
+        self.assertFalse(debug_config.is_debug_enabled("audio_processing_service"))
+
+        # When/Then: Enabling the wildcard is visible to the next check
+        debug_config.enable_debug("*")
+        self.assertTrue(debug_config.is_debug_enabled("audio_processing_service"))
+
+        # When/Then: Disabling everything is visible too
+        debug_config.disable_debug()
+        self.assertFalse(debug_config.is_debug_enabled("audio_processing_service"))
+
+    def test_wildcard_enables_every_component(self):
+        """Test that '*' enables debug for all components."""
+        debug_config.enable_debug("*")
+        self.assertTrue(debug_config.is_debug_enabled("any_component"))
+
+    def test_set_debug_flag_does_not_mutate_snapshot(self):
+        """Test that flag updates publish a new mapping instead of mutating the old one."""
+        # Given: A reader holding the current flags, with the audio flag off
+        debug_config.set_debug_flag("audio", False)
+        before = debug_config._debug_flags
+
+        # When: Setting a flag
+        debug_config.set_debug_flag("audio", True)
+
+        # Then: The new value is visible and the old snapshot is unchanged
+        self.assertTrue(debug_config.is_flag_enabled("audio"))
+        self.assertIsNot(debug_config._debug_flags, before)
+        self.assertFalse(before["audio"])
+
+    def test_debug_info_reports_environment_snapshot(self):
+        """Test that get_debug_info reports every debug variable as a plain dict."""
+        info = debug_config.get_debug_info()
+        self.assertIs(type(info["environment_vars"]), dict)
+        self.assertEqual(set(info["environment_vars"]), set(debug_config._DEBUG_ENV_VARS))
+
+
+if __name__ == "__main__":
+    unittest.main()
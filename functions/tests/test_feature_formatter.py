@@ -6,7 +6,6 @@ namespacing and Firestore formatting.
 """
 
 import unittest
-from unittest.mock import Mock
 from entities import FeatureSet, FeatureMetadata
 from utilities.feature_formatter import FeatureFormatter
 
@@ -14,10 +13,11 @@ from utilities.feature_formatter import FeatureFormatter
 class TestFeatureFormatter(unittest.TestCase):
     """Test cases for FeatureFormatter utility."""
     
-    def test_flatten_feature_sets_basic(self):
-        """Test basic feature set flattening with namespacing."""
-        # Given: VocalAnalysisExtractor feature set
-        vocal_features = FeatureSet(
+    @classmethod
+    def setUpClass(cls):
+        """Build shared FeatureSet fixtures and (feature sets, expected subset) cases once."""
+        # VocalAnalysisExtractor feature set
+        cls.VOCAL_OK = FeatureSet(
             extractor="vocal_analysis",
             version="1.0",
             features={
@@ -34,28 +34,8 @@ class TestFeatureFormatter(unittest.TestCase):
             error_message=None
         )
         
-        # When: Flattening feature sets
-        result = FeatureFormatter.flatten_feature_sets([vocal_features])
-        
-        # Then: Features should be namespaced
-        self.assertIn("vocal_analysis_f0_mean", result)
-        self.assertIn("vocal_analysis_f0_std", result)
-        self.assertIn("vocal_analysis_f0_confidence", result)
-        self.assertIn("vocal_analysis_jitter_local", result)
-        self.assertIn("vocal_analysis_shimmer_local", result)
-        self.assertIn("vocal_analysis_hnr_mean", result)
-        self.assertEqual(result["vocal_analysis_f0_mean"], 220.0)
-        self.assertEqual(result["vocal_analysis_f0_std"], 5.0)
-        self.assertEqual(result["vocal_analysis_f0_confidence"], 85.0)
-        self.assertEqual(result["vocal_analysis_jitter_local"], 0.5)
-        self.assertEqual(result["vocal_analysis_version"], "1.0")
-        self.assertEqual(result["vocal_analysis_metadata_voiced_ratio"], 0.8)
-        self.assertEqual(result["vocal_analysis_metadata_sample_rate"], 48000)
-    
-    def test_flatten_feature_sets_with_errors(self):
-        """Test feature set flattening with error handling."""
-        # Given: VocalAnalysisExtractor feature set with error
-        error_features = FeatureSet(
+        # VocalAnalysisExtractor feature set with error
+        cls.VOCAL_ERR = FeatureSet(
             extractor="vocal_analysis",
             version="1.0",
             features={
@@ -72,19 +52,8 @@ class TestFeatureFormatter(unittest.TestCase):
             error_message="Audio too short"
         )
         
-        # When: Flattening feature sets with errors
-        result = FeatureFormatter.flatten_feature_sets([error_features])
-        
-        # Then: Error information should be included
-        self.assertIn("vocal_analysis_error_type", result)
-        self.assertIn("vocal_analysis_error_message", result)
-        self.assertEqual(result["vocal_analysis_error_type"], "extraction_failed")
-        self.assertEqual(result["vocal_analysis_error_message"], "Audio too short")
-    
-    def test_flatten_multiple_extractors(self):
-        """Test flattening multiple extractors with different namespaces."""
-        # Given: VocalAnalysisExtractor and a future FormantExtractor
-        vocal_features = FeatureSet(
+        # Minimal vocal set plus a future FormantExtractor for reading tasks
+        cls.VOCAL_MINIMAL = FeatureSet(
             extractor="vocal_analysis",
             version="1.0",
             features={"f0_mean": 220.0, "f0_std": 5.0},
@@ -92,9 +61,7 @@ class TestFeatureFormatter(unittest.TestCase):
             error=None,
             error_message=None
         )
-        
-        # Mock future formant extractor for reading tasks
-        formant_features = FeatureSet(
+        cls.FORMANT_OK = FeatureSet(
             extractor="formant_analysis",
             version="1.0",
             features={"f1_mean": 800.0, "f2_mean": 1200.0},
@@ -103,38 +70,73 @@ class TestFeatureFormatter(unittest.TestCase):
             error_message=None
         )
         
-        # When: Flattening multiple feature sets
-        result = FeatureFormatter.flatten_feature_sets([vocal_features, formant_features])
-        
-        # Then: All features should be properly namespaced
-        self.assertIn("vocal_analysis_f0_mean", result)
-        self.assertIn("vocal_analysis_f0_std", result)
-        self.assertIn("formant_analysis_f1_mean", result)
-        self.assertIn("formant_analysis_f2_mean", result)
-        self.assertEqual(result["vocal_analysis_f0_mean"], 220.0)
-        self.assertEqual(result["formant_analysis_f1_mean"], 800.0)
-        self.assertEqual(result["vocal_analysis_version"], "1.0")
-        self.assertEqual(result["formant_analysis_version"], "1.0")
+        cls.CASES = [
+            ("basic", [cls.VOCAL_OK], {
+                "vocal_analysis_f0_mean": 220.0,
+                "vocal_analysis_f0_std": 5.0,
+                "vocal_analysis_f0_confidence": 85.0,
+                "vocal_analysis_jitter_local": 0.5,
+                "vocal_analysis_shimmer_local": 3.0,
+                "vocal_analysis_hnr_mean": 18.5,
+                "vocal_analysis_version": "1.0",
+                "vocal_analysis_metadata_voiced_ratio": 0.8,
+                "vocal_analysis_metadata_sample_rate": 48000,
+            }),
+            ("with_errors", [cls.VOCAL_ERR], {
+                "vocal_analysis_error_type": "extraction_failed",
+                "vocal_analysis_error_message": "Audio too short",
+            }),
+            ("multiple_extractors", [cls.VOCAL_MINIMAL, cls.FORMANT_OK], {
+                "vocal_analysis_f0_mean": 220.0,
+                "vocal_analysis_f0_std": 5.0,
+                "formant_analysis_f1_mean": 800.0,
+                "formant_analysis_f2_mean": 1200.0,
+                "vocal_analysis_version": "1.0",
+                "formant_analysis_version": "1.0",
+            }),
+        ]
     
-    def test_format_for_firestore(self):
-        """Test the format_for_firestore method."""
-        # Given: VocalAnalysisExtractor feature set
-        features = FeatureSet(
-            extractor="vocal_analysis",
+    def test_flatten_cases(self):
+        """Test namespacing, error fields and multi-extractor flattening."""
+        for name, feature_sets, expected in self.CASES:
+            with self.subTest(case=name):
+                # When: Flattening feature sets
+                result = FeatureFormatter.flatten_feature_sets(feature_sets)
+                
+                # Then: Expected namespaced keys should be present with their values
+                self.assertEqual({k: result.get(k) for k in expected}, expected)
+    
+    def test_flatten_large_feature_set(self):
+        """Test that wide feature sets flatten completely and in order."""
+        # Given: A feature set with 200 features
+        features = {f"feature_{i}": float(i) for i in range(200)}
+        wide_features = FeatureSet(
+            extractor="wide",
             version="1.0",
-            features={"f0_mean": 220.0},
-            metadata=FeatureMetadata(voiced_ratio=0.8),
-            error=None,
-            error_message=None
+            features=features,
+            metadata=FeatureMetadata(voiced_ratio=0.5)
         )
         
-        # When: Formatting for Firestore
-        result = FeatureFormatter.format_for_firestore([features])
+        # When: Flattening feature sets
+        result = FeatureFormatter.flatten_feature_sets([wide_features])
         
-        # Then: Should return the same as flatten_feature_sets
-        expected = FeatureFormatter.flatten_feature_sets([features])
-        self.assertEqual(result, expected)
+        # Then: Every feature is namespaced, in order, ahead of version and metadata
+        keys = list(result)
+        self.assertEqual(keys[:200], [f"wide_feature_{i}" for i in range(200)])
+        self.assertEqual(keys[200], "wide_version")
+        self.assertEqual(result["wide_feature_199"], 199.0)
+        self.assertEqual(result["wide_metadata_voiced_ratio"], 0.5)
+    
+    def test_format_for_firestore(self):
+        """Test that format_for_firestore matches flatten_feature_sets for every case."""
+        for name, feature_sets, _ in self.CASES:
+            with self.subTest(case=name):
+                # When: Formatting for Firestore
+                result = FeatureFormatter.format_for_firestore(feature_sets)
+                
+                # Then: Should return the same as flatten_feature_sets
+                self.assertEqual(result, FeatureFormatter.flatten_feature_sets(feature_sets))
 
 
 if __name__ == "__main__":
-    unittest.main() 
\ No newline at end of file
+    unittest.main()
@@ -0,0 +1,207 @@
+"""
+Tests for structured logging utilities.
+
+This module tests the StructuredLogger JSON output used for cloud
+logging integration.
+"""
+
+import io
+import json
+import logging
+import time
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+
+from utilities import structured_logging
+from utilities.structured_logging import (StructuredLogger, BufferedStreamHandler, _utc_timestamp,
+                                          get_structured_logger, get_audio_processing_logger)
+
+
+class TestStructuredLogger(unittest.TestCase):
+    """Test cases for StructuredLogger."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Create one logger for the class; tests only format messages."""
+        cls.logger = StructuredLogger("test_structured_logging")
+
+    def test_format_log_fields(self):
+        """Test that formatted logs are JSON with the standard fields."""
+        # When: Formatting a log with extra fields and a trace ID
+        result = json.loads(self.logger._format_log(
+            'info', "Processing", {"trace_id": "trace-1", "recording_id": "rec_123"}
+        ))
+
+        # Then: Should include the standard and structured fields
+        self.assertEqual(result['severity'], 'INFO')
+        self.assertEqual(result['logger'], "test_structured_logging")
+        self.assertEqual(result['message'], "Processing")
+        self.assertEqual(result['recording_id'], "rec_123")
+        self.assertEqual(result['trace_id'], "trace-1")
+        self.assertTrue(result['timestamp'].endswith('Z'))
+
+    def test_format_log_field_order(self):
+        """Test that the precomputed prefix keeps the standard field order."""
+        for extras in ({}, {"trace_id": "trace-1", "recording_id": "rec_123"}):
+            with self.subTest(extras=extras):
+                # When: Formatting with and without extra fields
+                result = json.loads(self.logger._format_log('ERROR', 'Say "hi"', dict(extras)))
+
+                # Then: Standard fields come first, then the extras with trace_id last
+                expected = ["timestamp", "severity", "logger", "message"]
+                if extras:
+                    expected += ["recording_id", "trace_id"]
+                self.assertEqual(list(result), expected)
+                self.assertEqual(result["message"], 'Say "hi"')
+
+    def test_format_log_numpy_and_non_str_keys(self):
+        """Test that numpy scalars and int-keyed dicts serialize on both encoders."""
+        fields = {
+            "rms": np.sqrt(np.float64(1e-8)),
+            "f0_mean": np.float32(220.5),
+            "frames": np.int64(300),
+            "histogram": {1: 2, 3: 4},
+        }
+        for name, orjson_module in (("orjson", structured_logging.orjson), ("json", None)):
+            with self.subTest(encoder=name), patch('utilities.structured_logging.orjson', orjson_module):
+                # When: Formatting fields with numpy values and int keys
+                result = json.loads(self.logger._format_log('WARNING', "Quiet", dict(fields)))
+
+                # Then: Values are plain JSON numbers and keys are strings
+                self.assertAlmostEqual(result['rms'], 1e-4)
+                self.assertAlmostEqual(result['f0_mean'], 220.5)
+                self.assertEqual(result['frames'], 300)
+                self.assertEqual(result['histogram'], {"1": 2, "3": 4})
+
+    def test_format_log_reserved_field_names(self):
+        """Test that fields named like base keys replace them instead of duplicating."""
+        for key in ("timestamp", "severity", "logger", "message"):
+            with self.subTest(key=key):
+                # When: A caller field collides with a base key
+                output = self.logger._format_log('WARNING', "Gate", {key: "caller", "rms": 0.1})
+
+                # Then: Each key appears once and the caller's value wins
+                pairs = json.loads(output, object_pairs_hook=list)
+                keys = [k for k, _ in pairs]
+                self.assertEqual(len(keys), len(set(keys)))
+                self.assertEqual(dict(pairs)[key], "caller")
+                self.assertEqual(dict(pairs)["rms"], 0.1)
+
+    def test_format_log_without_orjson(self):
+        """Test that the stdlib fallback produces the same timestamp format."""
+        # Given: orjson is unavailable
+        with patch('utilities.structured_logging.orjson', None):
+            # When: Formatting a log
+            result = json.loads(self.logger._format_log('warning', "Fallback", {}))
+
+        # Then: Should still produce UTC 'Z' timestamps
+        self.assertEqual(result['severity'], 'WARNING')
+        self.assertTrue(result['timestamp'].endswith('Z'))
+
+
+    def test_filtered_levels_skip_formatting(self):
+        """Test that records below the logger level are never formatted."""
+        # Given: An INFO-level logger
+        with patch.object(StructuredLogger, '_format_log') as mock_format:
+            # When: Logging below and at the threshold
+            self.logger.debug("Suppressed", detail=1)
+            mock_format.assert_not_called()
+            self.logger.info("Emitted")
+
+        # Then: Only the enabled record is formatted
+        mock_format.assert_called_once_with('INFO', "Emitted", {})
+
+    @patch('utilities.structured_logging.time.time_ns')
+    def test_timestamp_cached_within_millisecond(self, mock_time_ns):
+        """Test that timestamps are formatted once per millisecond."""
+        # Given: A clock that advances by less than a millisecond, then by one
+        mock_time_ns.side_effect = [1_700_000_000_123_000_000, 1_700_000_000_123_900_000,
+                                    1_700_000_000_124_000_000]
+
+        # When: Formatting three timestamps
+        first, second, third = _utc_timestamp(), _utc_timestamp(), _utc_timestamp()
+
+        # Then: Same-millisecond calls share one string; the next one is new
+        self.assertEqual(first, "2023-11-14T22:13:20.123Z")
+        self.assertIs(second, first)
+        self.assertEqual(third, "2023-11-14T22:13:20.124Z")
+
+    def test_factories_return_shared_instances(self):
+        """Test that logger factories reuse one instance per name."""
+        self.assertIs(get_structured_logger("shared"), get_structured_logger("shared"))
+        self.assertIsNot(get_structured_logger("shared"), get_structured_logger("other"))
+        self.assertIs(get_audio_processing_logger(), get_audio_processing_logger())
+
+    def test_error_embeds_traceback_once(self):
+        """Test that exceptions are logged as one JSON record with the traceback inside."""
+        # Given: A raised exception
+        try:
+            raise ValueError("bad audio")
+        except ValueError as e:
+            error = e
+
+        # When: Logging the error
+        with patch.object(self.logger.logger, 'error') as mock_error:
+            self.logger.error("Processing failed", exc=error)
+
+        # Then: The record is pure JSON with the traceback field, and no exc_info
+        args, kwargs = mock_error.call_args
+        self.assertEqual(kwargs, {})
+        record = json.loads(args[0])
+        self.assertEqual(record['exception'], "bad audio")
+        self.assertIn("ValueError: bad audio", record['stack_trace'])
+
+
+class TestBufferedStreamHandler(unittest.TestCase):
+    """Test cases for BufferedStreamHandler flushing."""
+
+    def setUp(self):
+        """Build a handler over an in-memory buffered stream."""
+        self.raw = io.BytesIO()
+        stream = io.TextIOWrapper(io.BufferedWriter(self.raw, buffer_size=65536),
+                                  encoding="utf-8", write_through=False)
+        self.handler = BufferedStreamHandler(stream, flush_interval=3600.0)
+        self.handler.setFormatter(logging.Formatter('%(message)s'))
+
+    def _emit(self, level, message):
+        self.handler.handle(logging.LogRecord("test", level, __file__, 0, message, None, None))
+
+    def test_info_records_stay_buffered(self):
+        """Test that routine records are batched until a flush."""
+        # When: Emitting INFO records
+        self._emit(logging.INFO, "first")
+        self._emit(logging.INFO, "second")
+
+        # Then: Nothing reaches the file until flushed
+        self.assertEqual(self.raw.getvalue(), b"")
+        self.handler.flush()
+        self.assertEqual(self.raw.getvalue(), b"first\nsecond\n")
+
+    def test_warning_flushes_immediately(self):
+        """Test that WARNING and above are written out with earlier records."""
+        # When: Emitting an INFO record followed by a WARNING
+        self._emit(logging.INFO, "routine")
+        self._emit(logging.WARNING, "problem")
+
+        # Then: Both are written in order without an explicit flush
+        self.assertEqual(self.raw.getvalue(), b"routine\nproblem\n")
+
+    def test_timer_bounds_buffering_time(self):
+        """Test that a lone INFO record is flushed within the flush interval."""
+        # Given: A short flush interval
+        self.handler.flush_interval = 0.05
+
+        # When: Emitting one INFO record and emitting nothing else
+        self._emit(logging.INFO, "trailing")
+
+        # Then: The timer flushes it without another record or explicit flush
+        deadline = time.monotonic() + 2.0
+        while not self.raw.getvalue() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(self.raw.getvalue(), b"trailing\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -9,7 +9,7 @@ Behavior: Extract comprehensive voice features from sustained vowel recordings
 """
 
 import unittest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock, patch
 import numpy as np
 import tempfile
 import os
@@ -26,9 +26,10 @@ class TestVocalAnalysisExtractorBehavior(unittest.TestCase):
     Context: Sustained vowel recordings from iOS app
     """
     
-    def setUp(self):
-        """Set up test fixtures following domain context."""
-        self.config = {
+    @classmethod
+    def setUpClass(cls):
+        """Build the config, extractor and synthetic audio once; tests only read them."""
+        cls.config = {
             'vocal_analysis': {
                 'min_f0_hz': 75,
                 'max_f0_hz': 500,
@@ -38,15 +39,53 @@ class TestVocalAnalysisExtractorBehavior(unittest.TestCase):
                 'max_shimmer_local': 10.0
             }
         }
-        self.extractor = VocalAnalysisExtractor(self.config)
         
         # Create synthetic sustained vowel audio (220 Hz sine wave = A4)
         duration = 2.0  # 2 seconds - sufficient for voice quality analysis
         sample_rate = 48000
-        t = np.linspace(0, duration, int(sample_rate * duration))
         frequency = 220  # Adult female typical F0
-        self.test_audio = np.sin(2 * np.pi * frequency * t) * 0.5
-        self.sample_rate = sample_rate
+        # Build the phase in float32 directly: no float64 time vector or temporaries
+        phase = np.arange(int(sample_rate * duration), dtype=np.float32)
+        phase *= np.float32(2 * np.pi * frequency / sample_rate)
+        cls.test_audio = np.sin(phase, out=phase)
+        cls.test_audio *= np.float32(0.5)
+        cls.test_audio.flags.writeable = False  # Shared across tests
+        cls.sample_rate = sample_rate
+        
+        # 0.1 s view for tests where Parselmouth is mocked and content is never analyzed
+        cls.short_audio = cls.test_audio[:int(0.1 * sample_rate)]
+        
+        # The extractor holds only config-derived settings, so one instance serves every test
+        cls.extractor = VocalAnalysisExtractor(cls.config)
+        
+        # Frozen Parselmouth output arrays shared by the mocked tests; constant
+        # contours are zero-allocation read-only broadcasts of a float32 scalar
+        cls._pitch_stable = np.broadcast_to(np.float32(220.0), (200,))  # Stable 220 Hz
+        cls._hnr_good = np.broadcast_to(np.float32(18.0), (200,))  # Good HNR
+        cls._hnr_poor = np.broadcast_to(np.float32(8.0), (200,))  # Poor HNR
+        cls._pitch_noisy = np.full(200, 220.0, dtype=np.float32)
+        cls._pitch_noisy[1::2] = 0  # 50% unvoiced frames
+        cls._pitch_noisy[::3] = 0  # Additional gaps - ~67% unvoiced frames (poor quality)
+        cls._pitch_noisy.flags.writeable = False
+    
+    def _install_parselmouth_mock(self, pitch_arr, hnr_arr, praat_side_effect):
+        """
+        Patch parselmouth.Sound and praat.call for the duration of the test.
+        
+        Args:
+            pitch_arr: Frequency array returned by the mocked pitch object
+            hnr_arr: Values array returned by the mocked harmonicity object
+            praat_side_effect: Sequence of praat.call return values
+        """
+        sound_patcher = patch('parselmouth.Sound')
+        mock_sound_class = sound_patcher.start()
+        self.addCleanup(sound_patcher.stop)
+        mock_sound = mock_sound_class.return_value
+        mock_sound.to_pitch.return_value.selected_array = {'frequency': pitch_arr}
+        mock_sound.to_harmonicity.return_value.values = hnr_arr
+        call_patcher = patch('parselmouth.praat.call', side_effect=praat_side_effect)
+        call_patcher.start()
+        self.addCleanup(call_patcher.stop)
     
     def test_extractor_follows_domain_naming_conventions(self):
         """
@@ -72,30 +111,15 @@ class TestVocalAnalysisExtractorBehavior(unittest.TestCase):
         When: Extracting vocal biomarkers
         Then: Should extract F0, jitter, shimmer, and HNR features
         """
-        with patch('parselmouth.Sound') as mock_sound_class:
-            # Mock Parselmouth objects following actual API
-            mock_sound = Mock()
-            mock_sound_class.return_value = mock_sound
-            
-            mock_pitch = Mock()
-            mock_pitch.selected_array = {'frequency': np.full(200, 220.0)}  # Stable 220 Hz
-            mock_sound.to_pitch.return_value = mock_pitch
-            
-            mock_harmonicity = Mock()
-            mock_harmonicity.values = np.full(200, 18.0)  # Good HNR
-            mock_sound.to_harmonicity.return_value = mock_harmonicity
-            
-            # Mock point process for jitter/shimmer
-            with patch('parselmouth.praat.call') as mock_praat_call:
-                mock_praat_call.side_effect = [
-                    Mock(),  # point process creation
-                    0.005,   # jitter local (0.5%)
-                    0.00002, # jitter absolute  
-                    0.03,    # shimmer local (3%)
-                    0.25,    # shimmer dB
-                ]
-                
-                result = self.extractor.extract(self.test_audio, self.sample_rate)
+        self._install_parselmouth_mock(self._pitch_stable, self._hnr_good, [
+            Mock(),  # point process creation
+            0.005,   # jitter local (0.5%)
+            0.00002, # jitter absolute  
+            0.03,    # shimmer local (3%)
+            0.25,    # shimmer dB
+        ])
+        
+        result = self.extractor.extract(self.short_audio, self.sample_rate)
         
         # Domain behavior assertions
         self.assertIsInstance(result, FeatureSet)
@@ -120,33 +144,16 @@ class TestVocalAnalysisExtractorBehavior(unittest.TestCase):
         When: Extracting vocal biomarkers  
         Then: Should return low confidence scores but still extract features
         """
-        with patch('parselmouth.Sound') as mock_sound_class:
-            mock_sound = Mock()
-            mock_sound_class.return_value = mock_sound
-            
-            # Simulate noisy pitch with gaps
-            noisy_pitch = np.full(200, 220.0)
-            noisy_pitch[1::2] = 0  # 50% unvoiced frames
-            noisy_pitch[::3] = 0  # Additional gaps - ~67% unvoiced frames (poor quality)
-            mock_pitch = Mock()
-            mock_pitch.selected_array = {'frequency': noisy_pitch}
-            mock_sound.to_pitch.return_value = mock_pitch
-            
-            # Poor voice quality parameters
-            mock_harmonicity = Mock()
-            mock_harmonicity.values = np.full(200, 8.0)  # Poor HNR
-            mock_sound.to_harmonicity.return_value = mock_harmonicity
-            
-            with patch('parselmouth.praat.call') as mock_praat_call:
-                mock_praat_call.side_effect = [
-                    Mock(),  # point process
-                    0.08,    # high jitter (8%)
-                    0.0008,  # high absolute jitter
-                    0.15,    # high shimmer (15%)
-                    1.2,     # high shimmer dB
-                ]
-                
-                result = self.extractor.extract(self.test_audio, self.sample_rate)
+        # Noisy pitch with gaps and poor voice quality parameters
+        self._install_parselmouth_mock(self._pitch_noisy, self._hnr_poor, [
+            Mock(),  # point process
+            0.08,    # high jitter (8%)
+            0.0008,  # high absolute jitter
+            0.15,    # high shimmer (15%)
+            1.2,     # high shimmer dB
+        ])
+        
+        result = self.extractor.extract(self.short_audio, self.sample_rate)
         
         # Should still extract features but with low confidence
         self.assertIsInstance(result, FeatureSet)
@@ -178,7 +185,7 @@ class TestVocalAnalysisExtractorBehavior(unittest.TestCase):
         Then: Should return zero values with error metadata for data consistency
         """
         with patch('parselmouth.Sound', side_effect=ImportError("Parselmouth not available")):
-            result = self.extractor.extract(self.test_audio, self.sample_rate)
+            result = self.extractor.extract(self.short_audio, self.sample_rate)
         
         # Data integrity assertions
         self.assertIsInstance(result, FeatureSet)
@@ -228,16 +235,17 @@ class TestVocalAnalysisExtractorBehavior(unittest.TestCase):
 class TestVocalAnalysisExtractorIntegration(unittest.TestCase):
     """Integration tests for vocal analysis extractor in research pipeline."""
     
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         """Set up integration test fixtures."""
-        self.config = {
+        cls.config = {
             'vocal_analysis': {
                 'min_f0_hz': 75,
                 'max_f0_hz': 500,
                 'time_step': 0.01
             }
         }
-        self.extractor = VocalAnalysisExtractor(self.config)
+        cls.extractor = VocalAnalysisExtractor(cls.config)
     
     def test_extractor_integrates_with_feature_pipeline(self):
         """